@@ -5,12 +5,15 @@ Aplicación principal desarrollada con Streamlit
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from data_processor import DataProcessor
 import io
 import base64
+import importlib.util
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Configuración de la página
@@ -21,8 +24,17 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# CSS personalizado para el diseño
-st.markdown("""
+# Ejes temáticos y su color en los gráficos
+EJE_CODES = ('E1', 'E2', 'E3', 'E4', 'E5', 'E6', 'E7')
+EJE_COLORS = ('#1f77b4', '#2ca02c', '#ff7f0e', '#9467bd', '#d62728', '#17becf', '#e377c2')
+EJE_COLOR_MAP = dict(zip(EJE_CODES, EJE_COLORS))
+
+# Extensiones de imagen admitidas en la galería (comparadas en minúsculas)
+IMAGE_EXTENSIONS = frozenset(('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp'))
+
+# CSS personalizado para el diseño. Se emite en cada ejecución del script:
+# Streamlit elimina de la página los elementos que un rerun no vuelve a enviar
+CUSTOM_CSS = """
 <style>
     .main-header {
         background: linear-gradient(90deg, #1f77b4 0%, #2ca02c 100%);
@@ -57,13 +69,89 @@ st.markdown("""
         background-color: white;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 # Inicializar el procesador de datos
 @st.cache_resource
 def init_data_processor():
     return DataProcessor()
 
+@st.cache_resource(show_spinner=False)
+def _plotly():
+    """Importa Plotly solo cuando una página dibuja gráficos (acelera el arranque)"""
+    import plotly.express as px
+    import plotly.graph_objects as go
+    return px, go
+
+def _cache_key(processor):
+    """Clave de caché (ruta, fecha de modificación) de los datos que el procesador tiene cargados"""
+    # Se usa la versión realmente cargada y no la del archivo en disco: si el CSV
+    # cambia durante un rerun, los datos anteriores no se guardan con la clave del archivo nuevo
+    return processor.data_version
+
+# Resultados derivados del CSV: se recalculan solo cuando el archivo cambia
+@st.cache_data(show_spinner=False)
+def _basic_stats(csv_path, mtime):
+    return init_data_processor().get_basic_stats()
+
+@st.cache_data(show_spinner=False)
+def _eje_analysis(csv_path, mtime):
+    return init_data_processor().get_eje_analysis()
+
+@st.cache_data(show_spinner=False)
+def _duplicates(csv_path, mtime):
+    return init_data_processor().detect_duplicates()
+
+@st.cache_data(show_spinner=False)
+def _unique_values(csv_path, mtime, column):
+    """Valores únicos ordenados de una columna, como tupla inmutable para los filtros"""
+    return tuple(init_data_processor().get_unique_values(column))
+
+@st.cache_data(show_spinner=False)
+def _search_index(csv_path, mtime, column):
+    """Valores únicos de una columna y su versión en minúsculas, para búsqueda por subcadena"""
+    values = np.array(_unique_values(csv_path, mtime, column), dtype=str)
+    return values, np.char.lower(values)
+
+@st.cache_data(show_spinner=False)
+def _compute_ranking(csv_path, mtime, top_n, filter_by_eje):
+    """Top N ponencias evaluadas por puntaje, opcionalmente filtradas por eje"""
+    processor = init_data_processor()
+    _, top = processor.get_ranking_positions(top_n, filter_by_eje)
+    return processor.df.iloc[top]
+
+@st.cache_resource(show_spinner=False)
+def _png_executor():
+    """Hilo en segundo plano, compartido entre reruns y sesiones, para renderizar PNG con Kaleido"""
+    return ThreadPoolExecutor(max_workers=1)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _fig_png(fig_json):
+    """Renderiza un gráfico (en JSON) a PNG; evita relanzar Kaleido para el mismo gráfico"""
+    import plotly.io as pio
+    return pio.from_json(fig_json).to_image(format="png", width=800, height=600)
+
+def _fig_png_future(fig_json):
+    """
+    Renderizado PNG en segundo plano del gráfico mostrado en esta sesión
+
+    Se reutiliza la tarea mientras el gráfico no cambie; al cambiar, se cancela la tarea
+    anterior si aún no empezó, para que la exportación no espere detrás de gráficos
+    que ya no se muestran. Un gráfico ya renderizado (en esta u otra sesión) se lee
+    de la caché de _fig_png sin volver a lanzar Kaleido.
+    """
+    previous = st.session_state.get('png_future')
+    if previous is not None:
+        previous_json, previous_future = previous
+        if previous_json == fig_json and not previous_future.cancelled():
+            return previous_future
+        previous_future.cancel()
+
+    future = _png_executor().submit(_fig_png, fig_json)
+    st.session_state['png_future'] = (fig_json, future)
+    return future
+
 def main():
     """Función principal de la aplicación"""
 
@@ -118,7 +206,7 @@ def main():
     st.sidebar.markdown("---")
     st.sidebar.markdown("### 📋 Resumen General")
     
-    basic_stats = processor.get_basic_stats()
+    basic_stats = _basic_stats(*_cache_key(processor))
     if basic_stats:
         st.sidebar.metric("Total Ponencias", basic_stats['total_ponencias'])
         st.sidebar.metric("Países Participantes", basic_stats['total_paises'])
@@ -140,10 +228,56 @@ def main():
     elif page_key == "gallery":
         render_gallery_page()
 
+def _eje_bar_figure(data, title):
+    """Gráfico de barras {eje: valor} construido directamente con graph_objects"""
+    _, go = _plotly()
+    ejes = list(data.keys())
+    fig = go.Figure(go.Bar(
+        x=ejes,
+        y=list(data.values()),
+        marker_color=[EJE_COLOR_MAP.get(eje, '#1f77b4') for eje in ejes]
+    ))
+    fig.update_layout(title=title, showlegend=False)
+    return fig
+
+def _eje_pie_figure(data, title):
+    """Gráfico de pie {eje: valor} construido directamente con graph_objects"""
+    _, go = _plotly()
+    ejes = list(data.keys())
+    fig = go.Figure(go.Pie(
+        labels=ejes,
+        values=list(data.values()),
+        marker_colors=[EJE_COLOR_MAP.get(eje, '#1f77b4') for eje in ejes]
+    ))
+    fig.update_layout(title=title)
+    return fig
+
+def _pie_figure(data, title, textinfo='percent+label+value', colors=None):
+    """Gráfico de pie {etiqueta: valor} construido directamente con graph_objects"""
+    _, go = _plotly()
+    fig = go.Figure(go.Pie(
+        labels=list(data.keys()),
+        values=list(data.values()),
+        marker_colors=list(colors) if colors else None
+    ))
+    fig.update_layout(title=title)
+    fig.update_traces(textposition='inside', textinfo=textinfo)
+    return fig
+
+def _format_percentages(data, template, total=None):
+    """Formatea conteos y su porcentaje sobre el total (por defecto, su suma) como un único bloque Markdown"""
+    values = np.fromiter(data.values(), dtype=np.int64, count=len(data))
+    if total is None:
+        total = values.sum()
+    percentages = values * (100.0 / total) if total > 0 else np.zeros(len(values))
+    return "  \n".join(template.format(key, value, pct) for key, value, pct in zip(data, values, percentages))
+
 def render_home_page(processor, basic_stats):
     """Renderiza la página principal con métricas generales"""
     
     st.header("🏠 Panel Principal")
+
+    px, go = _plotly()
     
     if not basic_stats:
         st.warning("No hay datos disponibles para mostrar.")
@@ -174,7 +308,7 @@ def render_home_page(processor, basic_stats):
         )
     
     with col4:
-        total_ejes = len([k for k in basic_stats['distribucion_eje'].keys() if k in ['E1', 'E2', 'E3', 'E4', 'E5', 'E6', 'E7']])
+        total_ejes = len([k for k in basic_stats['distribucion_eje'].keys() if k in EJE_CODES])
         st.metric(
             label="📊 Ejes Temáticos",
             value=total_ejes,
@@ -193,29 +327,19 @@ def render_home_page(processor, basic_stats):
             eje_data = basic_stats['distribucion_eje']
 
             # Filtrar solo E1-E7
-            eje_filtered = {k: v for k, v in eje_data.items() if k in ['E1', 'E2', 'E3', 'E4', 'E5', 'E6', 'E7']}
+            eje_filtered = {k: v for k, v in eje_data.items() if k in EJE_CODES}
 
             if eje_filtered:
                 # Crear gráfico de barras
-                fig = px.bar(
-                    x=list(eje_filtered.keys()),
-                    y=list(eje_filtered.values()),
-                    color=list(eje_filtered.keys()),
-                    color_discrete_map={'E1': '#1f77b4', 'E2': '#2ca02c', 'E3': '#ff7f0e', 'E4': '#9467bd', 'E5': '#d62728', 'E6': '#17becf', 'E7': '#e377c2'},
-                    title="Ponencias por Eje"
-                )
+                fig = _eje_bar_figure(eje_filtered, "Ponencias por Eje")
                 fig.update_layout(
-                    showlegend=False,
                     xaxis_title="Eje Temático",
                     yaxis_title="Número de Ponencias"
                 )
                 st.plotly_chart(fig, use_container_width=True)
                 
                 # Mostrar porcentajes
-                total = sum(eje_filtered.values())
-                for eje, count in eje_filtered.items():
-                    percentage = (count / total * 100) if total > 0 else 0
-                    st.write(f"**{eje}**: {count} ponencias ({percentage:.1f}%)")
+                st.markdown(_format_percentages(eje_filtered, "**{}**: {} ponencias ({:.1f}%)"))
     
     with col2:
         st.subheader("🌍 Top 5 Países Participantes")
@@ -224,12 +348,7 @@ def render_home_page(processor, basic_stats):
             paises_data = basic_stats['paises_top']
             
             # Crear gráfico de pie
-            fig = px.pie(
-                values=list(paises_data.values()),
-                names=list(paises_data.keys()),
-                title="Distribución por País"
-            )
-            fig.update_traces(textposition='inside', textinfo='percent+label')
+            fig = _pie_figure(paises_data, "Distribución por País", textinfo='percent+label')
             st.plotly_chart(fig, use_container_width=True)
     
     # Instituciones top
@@ -253,43 +372,25 @@ def render_home_page(processor, basic_stats):
         st.write("**Estado de Presentación:**")
         if 'presento_stats' in basic_stats:
             presento_data = basic_stats['presento_stats']
-            total = sum(presento_data.values())
 
             # Crear gráfico de pie
-            fig = px.pie(
-                values=list(presento_data.values()),
-                names=list(presento_data.keys()),
-                title="¿Presentó?",
-                color_discrete_sequence=['#2ca02c', '#d62728']
-            )
-            fig.update_traces(textposition='inside', textinfo='percent+label+value')
+            fig = _pie_figure(presento_data, "¿Presentó?", colors=('#2ca02c', '#d62728'))
             st.plotly_chart(fig, use_container_width=True)
 
             # Mostrar detalles
-            for status, count in presento_data.items():
-                percentage = (count / total * 100) if total > 0 else 0
-                st.write(f"• {status}: {count} ({percentage:.1f}%)")
+            st.markdown(_format_percentages(presento_data, "• {}: {} ({:.1f}%)"))
 
     with col2:
         st.write("**Tipo de Ponencia:**")
         if 'ponencia_stats' in basic_stats:
             ponencia_data = basic_stats['ponencia_stats']
-            total = sum(ponencia_data.values())
 
             # Crear gráfico de pie
-            fig = px.pie(
-                values=list(ponencia_data.values()),
-                names=list(ponencia_data.keys()),
-                title="¿Ponencia Oral?",
-                color_discrete_sequence=['#ff7f0e', '#1f77b4']
-            )
-            fig.update_traces(textposition='inside', textinfo='percent+label+value')
+            fig = _pie_figure(ponencia_data, "¿Ponencia Oral?", colors=('#ff7f0e', '#1f77b4'))
             st.plotly_chart(fig, use_container_width=True)
 
             # Mostrar detalles
-            for status, count in ponencia_data.items():
-                percentage = (count / total * 100) if total > 0 else 0
-                st.write(f"• {status}: {count} ({percentage:.1f}%)")
+            st.markdown(_format_percentages(ponencia_data, "• {}: {} ({:.1f}%)"))
 
     st.markdown("---")
 
@@ -313,35 +414,35 @@ def render_home_page(processor, basic_stats):
             st.metric("Puntaje Máximo", f"{puntaje_max:.2f}")
             st.metric("Puntaje Mínimo", f"{puntaje_min:.2f}")
 
-            # Histograma de puntajes
-            fig = px.histogram(
-                df,
-                x='Puntaje',
-                nbins=20,
-                title="Distribución de Puntajes",
-                color_discrete_sequence=['#1f77b4']
-            )
+            # Histograma de puntajes: los bins se calculan aquí para enviar
+            # solo 20 barras al navegador en lugar de todos los registros
+            counts, edges = np.histogram(df['Puntaje'].dropna().to_numpy(), bins=20)
+            fig = go.Figure(go.Bar(
+                x=(edges[:-1] + edges[1:]) / 2,
+                y=counts,
+                width=np.diff(edges),
+                marker_color='#1f77b4'
+            ))
             fig.update_layout(
+                title="Distribución de Puntajes",
                 xaxis_title="Puntaje",
-                yaxis_title="Frecuencia"
+                yaxis_title="Frecuencia",
+                bargap=0
             )
             st.plotly_chart(fig, use_container_width=True)
 
         with col2:
             st.write("**Top 10 Ponencias por Puntaje:**")
 
-            # Top 10 ponencias - solo las que deben ser evaluadas
-            df_evaluables = df.copy()
-            if 'Evaluar' in df.columns:
-                df_evaluables = df_evaluables[df_evaluables['Evaluar'].str.upper() == 'SI']
-
-            # Filtrar solo los que tienen puntaje válido
-            df_evaluables = df_evaluables[df_evaluables['Puntaje'].notna()]
+            # Top 10 ponencias - solo las que deben ser evaluadas y tienen puntaje válido
+            _, top = processor.get_ranking_positions(10)
 
-            top_10 = df_evaluables.nlargest(10, 'Puntaje')[['Nombres', 'Apellidos', 'Eje', 'Puntaje', 'Resultado']]
-            top_10['Autor'] = top_10['Nombres'] + ' ' + top_10['Apellidos']
-            top_10_display = top_10[['Resultado', 'Autor', 'Eje', 'Puntaje']].copy()
-            top_10_display.columns = ['Rank', 'Autor', 'Eje', 'Puntaje']
+            top_10_display = pd.DataFrame({
+                'Rank': df['Resultado'].array[top],
+                'Autor': df['Nombre_Completo'].array[top],
+                'Eje': df['Eje'].array[top],
+                'Puntaje': df['Puntaje'].array[top]
+            })
 
             st.dataframe(
                 top_10_display,
@@ -357,7 +458,7 @@ def render_home_page(processor, basic_stats):
                 orientation='h',
                 title="Top 10 Puntajes",
                 color='Eje',
-                color_discrete_map={'E1': '#1f77b4', 'E2': '#2ca02c', 'E3': '#ff7f0e', 'E4': '#9467bd', 'E5': '#d62728', 'E6': '#17becf', 'E7': '#e377c2'}
+                color_discrete_map=EJE_COLOR_MAP
             )
             fig.update_layout(
                 yaxis={'categoryorder': 'total ascending'},
@@ -371,7 +472,7 @@ def render_eje_analysis_page(processor):
     
     st.header("📈 Análisis por Eje Temático")
     
-    eje_stats = processor.get_eje_analysis()
+    eje_stats = _eje_analysis(*_cache_key(processor))
     
     if not eje_stats:
         st.warning("No hay datos disponibles para el análisis por eje.")
@@ -380,8 +481,8 @@ def render_eje_analysis_page(processor):
     # Selector de eje para análisis detallado
     selected_ejes = st.multiselect(
         "Seleccionar ejes para análisis:",
-        options=['E1', 'E2', 'E3', 'E4', 'E5', 'E6', 'E7'],
-        default=['E1', 'E2', 'E3', 'E4', 'E5', 'E6', 'E7']
+        options=list(EJE_CODES),
+        default=list(EJE_CODES)
     )
     
     if not selected_ejes:
@@ -419,27 +520,14 @@ def render_eje_analysis_page(processor):
         eje_data = {eje: eje_stats[eje]['total'] for eje in selected_ejes if eje in eje_stats}
         
         if eje_data:
-            fig = px.bar(
-                x=list(eje_data.keys()),
-                y=list(eje_data.values()),
-                color=list(eje_data.keys()),
-                color_discrete_map={'E1': '#1f77b4', 'E2': '#2ca02c', 'E3': '#ff7f0e', 'E4': '#9467bd', 'E5': '#d62728', 'E6': '#17becf', 'E7': '#e377c2'},
-                title="Ponencias por Eje Seleccionado"
-            )
-            fig.update_layout(showlegend=False)
+            fig = _eje_bar_figure(eje_data, "Ponencias por Eje Seleccionado")
             st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.subheader("🥧 Distribución Porcentual")
         
         if eje_data:
-            fig = px.pie(
-                values=list(eje_data.values()),
-                names=list(eje_data.keys()),
-                color=list(eje_data.keys()),
-                color_discrete_map={'E1': '#1f77b4', 'E2': '#2ca02c', 'E3': '#ff7f0e', 'E4': '#9467bd', 'E5': '#d62728', 'E6': '#17becf', 'E7': '#e377c2'},
-                title="Distribución Porcentual por Eje"
-            )
+            fig = _eje_pie_figure(eje_data, "Distribución Porcentual por Eje")
             st.plotly_chart(fig, use_container_width=True)
     
     # Análisis detallado por eje
@@ -460,16 +548,16 @@ def render_eje_analysis_page(processor):
                 
                 with col2:
                     st.write("**Distribución por países:**")
-                    paises_eje = eje_info['paises_list']
-                    for pais, count in list(paises_eje.items())[:5]:  # Top 5
-                        st.write(f"• {pais}: {count} ponencias")
+                    paises_eje = list(eje_info['paises_list'].items())[:5]  # Top 5
+                    if paises_eje:
+                        st.table(pd.DataFrame(paises_eje, columns=['País', 'Ponencias']).set_index('País'))
 
 def render_duplicates_page(processor):
     """Renderiza la página de gestión de duplicados"""
     
     st.header("👥 Gestión de Duplicados")
     
-    duplicate_analysis = processor.detect_duplicates()
+    duplicate_analysis = _duplicates(*_cache_key(processor))
     
     if not duplicate_analysis or duplicate_analysis['total_duplicados'] == 0:
         st.success("✅ No se encontraron nombres duplicados en la base de datos.")
@@ -507,27 +595,14 @@ def render_duplicates_page(processor):
         
         eje_duplicates = duplicate_analysis['por_eje']
         if eje_duplicates:
-            fig = px.bar(
-                x=list(eje_duplicates.keys()),
-                y=list(eje_duplicates.values()),
-                color=list(eje_duplicates.keys()),
-                color_discrete_map={'E1': '#1f77b4', 'E2': '#2ca02c', 'E3': '#ff7f0e', 'E4': '#9467bd', 'E5': '#d62728', 'E6': '#17becf', 'E7': '#e377c2'},
-                title="Registros Duplicados por Eje"
-            )
-            fig.update_layout(showlegend=False)
+            fig = _eje_bar_figure(eje_duplicates, "Registros Duplicados por Eje")
             st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.subheader("🥧 Distribución Porcentual")
         
         if eje_duplicates and sum(eje_duplicates.values()) > 0:
-            fig = px.pie(
-                values=list(eje_duplicates.values()),
-                names=list(eje_duplicates.keys()),
-                color=list(eje_duplicates.keys()),
-                color_discrete_map={'E1': '#1f77b4', 'E2': '#2ca02c', 'E3': '#ff7f0e', 'E4': '#9467bd', 'E5': '#d62728', 'E6': '#17becf', 'E7': '#e377c2'},
-                title="% Duplicados por Eje"
-            )
+            fig = _eje_pie_figure(eje_duplicates, "% Duplicados por Eje")
             st.plotly_chart(fig, use_container_width=True)
     
     # Lista detallada de duplicados
@@ -536,20 +611,21 @@ def render_duplicates_page(processor):
     for i, duplicate in enumerate(duplicate_analysis['registros']):
         with st.expander(f"👤 {duplicate['nombre']} ({duplicate['cantidad']} registros)"):
             
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.write(f"**Nombre:** {duplicate['nombre']}")
-                st.write(f"**Cantidad de registros:** {duplicate['cantidad']}")
-                st.write(f"**IDs:** {', '.join(map(str, duplicate['ids']))}")
-            
-            with col2:
-                st.write(f"**Ejes:** {', '.join(duplicate['ejes'])}")
-                st.write(f"**Países:** {', '.join(set(duplicate['paises']))}")
-                st.write(f"**Instituciones:** {', '.join(set(duplicate['instituciones']))}")
+            # Resumen del grupo en una sola tabla
+            st.table(pd.DataFrame({
+                'Campo': ['Nombre', 'Cantidad de registros', 'IDs', 'Ejes', 'Países', 'Instituciones'],
+                'Valor': [
+                    duplicate['nombre'],
+                    str(duplicate['cantidad']),
+                    ', '.join(map(str, duplicate['ids'])),
+                    ', '.join(duplicate['ejes']),
+                    ', '.join(set(duplicate['paises'])),
+                    ', '.join(set(duplicate['instituciones']))
+                ]
+            }).set_index('Campo'))
             
             # Mostrar registros específicos
-            duplicate_records = processor.df[processor.df['Id'].isin(duplicate['ids'])]
+            duplicate_records = processor.get_records_by_ids(duplicate['ids'])
             st.dataframe(
                 duplicate_records[['Id', 'Nombres', 'Apellidos', 'Título', 'Eje', 'País', 'Institución']],
                 use_container_width=True
@@ -559,6 +635,14 @@ def render_visualizations_page(processor):
     """Renderiza la página de visualizaciones interactivas"""
     
     st.header("📊 Visualizaciones Interactivas")
+
+    render_visualizations_fragment(processor)
+
+@st.fragment
+def render_visualizations_fragment(processor):
+    """Controles y gráfico de visualizaciones; se re-ejecuta sin recargar el resto de la página"""
+
+    px, _ = _plotly()
     
     # Controles de personalización
     col1, col2, col3 = st.columns(3)
@@ -592,7 +676,7 @@ def render_visualizations_page(processor):
     
     # Procesar datos según el campo seleccionado
     if analysis_field in df.columns:
-        data_counts = df[analysis_field].value_counts().head(top_n)
+        data_counts = processor.get_top_counts(analysis_field, top_n)
         
         # Crear gráfico según el tipo seleccionado
         if chart_type == "Barras":
@@ -628,9 +712,8 @@ def render_visualizations_page(processor):
         
         # Personalizar colores para Eje
         if analysis_field == "Eje":
-            color_map = {'E1': '#1f77b4', 'E2': '#2ca02c', 'E3': '#ff7f0e', 'E4': '#9467bd', 'E5': '#d62728', 'E6': '#17becf', 'E7': '#e377c2'}
             fig.update_traces(
-                marker_color=[color_map.get(x, '#1f77b4') for x in data_counts.index]
+                marker_color=[EJE_COLOR_MAP.get(x, '#1f77b4') for x in data_counts.index]
             )
         
         fig.update_layout(
@@ -639,6 +722,9 @@ def render_visualizations_page(processor):
         )
         
         st.plotly_chart(fig, use_container_width=True)
+
+        # Preparar el PNG de exportación mientras el usuario interactúa con la página
+        png_future = _fig_png_future(fig.to_json())
         
         # Tabla de datos
         st.subheader("📋 Datos de la Visualización")
@@ -653,8 +739,13 @@ def render_visualizations_page(processor):
         
         # Botón de exportación
         if st.button("📥 Exportar Gráfico"):
-            # Convertir gráfico a imagen
-            img_bytes = fig.to_image(format="png", width=800, height=600)
+            # Esperar la imagen generada en segundo plano (normalmente ya está lista)
+            try:
+                img_bytes = png_future.result()
+            except Exception:
+                # No conservar la tarea fallida para poder reintentar
+                st.session_state.pop('png_future', None)
+                raise
             
             st.download_button(
                 label="Descargar PNG",
@@ -663,39 +754,75 @@ def render_visualizations_page(processor):
                 mime="image/png"
             )
 
+# Claves de session_state de los widgets de filtro
+FILTER_KEYS = ('flt_eje', 'flt_pais', 'flt_inst_query', 'flt_inst', 'flt_pres', 'flt_pon',
+               'flt_sitio', 'flt_puntaje', 'flt_resultado', 'flt_texto')
+
+def _active_range(selected, min_value, max_value):
+    """Rango elegido en un slider, o None si abarca todos los valores posibles"""
+    if selected[0] <= min_value and selected[1] >= max_value:
+        return None
+    return selected
+
+def _clear_filters():
+    """Restablece los widgets de filtro a sus valores por defecto"""
+    for key in FILTER_KEYS:
+        st.session_state.pop(key, None)
+
 def render_filters_page(processor):
     """Renderiza la página de filtros y búsqueda"""
     
     st.header("🔍 Filtros y Búsqueda Avanzada")
+
+    render_filters_fragment(processor)
+
+@st.fragment
+def render_filters_fragment(processor):
+    """Filtros, resultados y exportación; se re-ejecutan sin recargar el resto de la página"""
+
+    cache_key = _cache_key(processor)
     
     # Controles de filtro
     col1, col2, col3 = st.columns(3)
 
     with col1:
         # Filtro por Eje
-        ejes_disponibles = processor.get_unique_values('Eje')
+        ejes_disponibles = _unique_values(*cache_key, 'Eje')
         selected_ejes = st.multiselect(
             "Filtrar por Eje:",
             options=ejes_disponibles,
-            default=[]
+            default=[],
+            key='flt_eje'
         )
 
     with col2:
         # Filtro por País
-        paises_disponibles = processor.get_unique_values('País')
+        paises_disponibles = _unique_values(*cache_key, 'País')
         selected_paises = st.multiselect(
             "Filtrar por País:",
             options=paises_disponibles,
-            default=[]
+            default=[],
+            key='flt_pais'
         )
 
     with col3:
-        # Filtro por Institución
-        instituciones_disponibles = processor.get_unique_values('Institución')
+        # Filtro por Institución: se busca en la lista completa y solo se
+        # envían al navegador las primeras coincidencias
+        instituciones, instituciones_lower = _search_index(*cache_key, 'Institución')
+        inst_query = st.text_input(
+            "Buscar institución:",
+            placeholder="Escriba parte del nombre...",
+            key='flt_inst_query'
+        )
+        matches = instituciones[np.char.find(instituciones_lower, inst_query.strip().lower()) >= 0]
+        # Mantener las instituciones ya seleccionadas entre las opciones
+        selected = st.session_state.get('flt_inst', [])
+        inst_options = selected + [inst for inst in matches[:50].tolist() if inst not in selected]
         selected_instituciones = st.multiselect(
             "Filtrar por Institución:",
-            options=instituciones_disponibles[:20],  # Limitar para performance
-            default=[]
+            options=inst_options,
+            default=[],
+            key='flt_inst'
         )
 
     # Segunda fila de filtros
@@ -703,29 +830,32 @@ def render_filters_page(processor):
 
     with col4:
         # Filtro por Presentó
-        presento_disponibles = processor.get_unique_values('Presentó')
+        presento_disponibles = _unique_values(*cache_key, 'Presentó')
         selected_presento = st.multiselect(
             "Filtrar por Presentó:",
             options=presento_disponibles,
-            default=[]
+            default=[],
+            key='flt_pres'
         )
 
     with col5:
         # Filtro por Ponencia
-        ponencia_disponibles = processor.get_unique_values('Ponencia')
+        ponencia_disponibles = _unique_values(*cache_key, 'Ponencia')
         selected_ponencia = st.multiselect(
             "Filtrar por Ponencia:",
             options=ponencia_disponibles,
-            default=[]
+            default=[],
+            key='flt_pon'
         )
 
     with col6:
         # Filtro por Sitio
-        sitio_disponibles = processor.get_unique_values('Sitio')
+        sitio_disponibles = _unique_values(*cache_key, 'Sitio')
         selected_sitio = st.multiselect(
             "Filtrar por Sitio:",
             options=sitio_disponibles,
-            default=[]
+            default=[],
+            key='flt_sitio'
         )
 
     # Tercera fila de filtros - Evaluación
@@ -745,7 +875,8 @@ def render_filters_page(processor):
                 min_value=puntaje_min,
                 max_value=puntaje_max,
                 value=(puntaje_min, puntaje_max),
-                step=0.01
+                step=0.01,
+                key='flt_puntaje'
             )
 
         with col7:
@@ -758,8 +889,14 @@ def render_filters_page(processor):
                 min_value=resultado_min,
                 max_value=resultado_max,
                 value=(resultado_min, resultado_max),
-                step=1
+                step=1,
+                key='flt_resultado'
             )
+
+        # Un rango en sus límites completos no restringe nada: se envía None para que
+        # filter_data no descarte las ponencias sin puntaje ni ranking
+        selected_puntaje_range = _active_range(selected_puntaje_range, puntaje_min, puntaje_max)
+        selected_resultado_range = _active_range(selected_resultado_range, resultado_min, resultado_max)
     else:
         selected_puntaje_range = None
         selected_resultado_range = None
@@ -767,12 +904,12 @@ def render_filters_page(processor):
     # Búsqueda de texto
     search_text = st.text_input(
         "🔍 Búsqueda de texto (en títulos, nombres, instituciones):",
-        placeholder="Ingrese términos de búsqueda..."
+        placeholder="Ingrese términos de búsqueda...",
+        key='flt_texto'
     )
     
-    # Botón para limpiar filtros
-    if st.button("🧹 Limpiar Filtros"):
-        st.experimental_rerun()
+    # Botón para limpiar filtros (el callback se ejecuta antes del siguiente rerun)
+    st.button("🧹 Limpiar Filtros", on_click=_clear_filters)
     
     # Aplicar filtros
     filters = {
@@ -832,11 +969,15 @@ def render_filters_page(processor):
             col1, col2 = st.columns(2)
             
             with col1:
-                # Exportar a CSV
-                csv_data = filtered_df[selected_columns].to_csv(index=False)
+                # Exportar a CSV con el escritor de Arrow (implementado en C)
+                csv_buffer = io.BytesIO()
+                pacsv.write_csv(
+                    pa.Table.from_pandas(filtered_df[selected_columns], preserve_index=False),
+                    csv_buffer
+                )
                 st.download_button(
                     label="📄 Descargar CSV",
-                    data=csv_data,
+                    data=csv_buffer.getvalue(),
                     file_name="datos_filtrados.csv",
                     mime="text/csv"
                 )
@@ -861,24 +1002,26 @@ def render_filters_page(processor):
         st.subheader("📊 Estadísticas de Datos Filtrados")
         
         if 'Eje' in filtered_df.columns:
-            eje_counts = filtered_df['Eje'].value_counts()
+            filtered_mask = processor.df.index.isin(filtered_df.index)
+            eje_counts = pd.Series({
+                eje: count for eje, count in processor.count_by_eje(filtered_mask).items() if count > 0
+            }, dtype='int64')
             
             col1, col2 = st.columns(2)
             
             with col1:
                 st.write("**Distribución por Eje:**")
-                for eje, count in eje_counts.items():
-                    percentage = (count / len(filtered_df) * 100) if len(filtered_df) > 0 else 0
-                    st.write(f"• {eje}: {count} ({percentage:.1f}%)")
+                st.markdown(_format_percentages(eje_counts.to_dict(), "• {}: {} ({:.1f}%)", total=len(filtered_df)))
             
             with col2:
                 if len(eje_counts) > 0:
+                    px, _ = _plotly()
                     fig = px.pie(
                         values=eje_counts.values,
                         names=eje_counts.index,
                         title="Distribución por Eje (Datos Filtrados)",
                         color=eje_counts.index,
-                        color_discrete_map={'E1': '#1f77b4', 'E2': '#2ca02c', 'E3': '#ff7f0e', 'E4': '#9467bd', 'E5': '#d62728', 'E6': '#17becf', 'E7': '#e377c2'}
+                        color_discrete_map=EJE_COLOR_MAP
                     )
                     st.plotly_chart(fig, use_container_width=True)
     
@@ -928,10 +1071,9 @@ def render_pdf_export_page(processor):
     
     with col2:
         # Filtro por eje
-        eje_options = ["Todos los ejes"] + processor.eje_values
         selected_eje = st.selectbox(
             "Filtrar por Eje Temático:",
-            options=eje_options,
+            options=processor.eje_options_with_all,
             help="Puede generar el ranking solo para un eje específico"
         )
         
@@ -972,40 +1114,29 @@ def render_pdf_export_page(processor):
     st.markdown("---")
     st.subheader("👀 Vista Previa del Ranking")
     
-    # Obtener datos para preview
-    df_preview = processor.df.copy()
-
-    # Solo incluir registros con Evaluar='SI' si la columna existe
-    if 'Evaluar' in df_preview.columns:
-        df_preview = df_preview[df_preview['Evaluar'].str.upper() == 'SI']
-
-    # Filtrar por eje si se especifica
-    if filter_by_eje:
-        df_preview = df_preview[df_preview['Eje'] == filter_by_eje]
-
-    # Filtrar solo los que tienen puntaje válido
-    df_preview = df_preview[df_preview['Puntaje'].notna()]
-
-    # Ordenar por puntaje y tomar los top N
-    df_preview = df_preview.nlargest(top_n, 'Puntaje')
+    # Obtener datos para preview (en caché según los datos y los filtros)
+    df_preview = _compute_ranking(*_cache_key(processor), top_n, filter_by_eje)
     
-    # Mostrar métricas
+    # Mostrar métricas (máximo, mínimo y promedio en una sola agregación)
+    ranking_count = len(df_preview)
+    score_stats = df_preview['Puntaje'].agg(['max', 'min', 'mean']) if ranking_count else None
+
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("📊 Ponencias en el ranking", len(df_preview))
+        st.metric("📊 Ponencias en el ranking", ranking_count)
     
     with col2:
-        if len(df_preview) > 0:
-            st.metric("🏆 Puntaje más alto", f"{df_preview['Puntaje'].max():.2f}")
+        if ranking_count > 0:
+            st.metric("🏆 Puntaje más alto", f"{score_stats['max']:.2f}")
     
     with col3:
-        if len(df_preview) > 0:
-            st.metric("📉 Puntaje más bajo", f"{df_preview['Puntaje'].min():.2f}")
+        if ranking_count > 0:
+            st.metric("📉 Puntaje más bajo", f"{score_stats['min']:.2f}")
     
     with col4:
-        if len(df_preview) > 0:
-            st.metric("📊 Puntaje promedio", f"{df_preview['Puntaje'].mean():.2f}")
+        if ranking_count > 0:
+            st.metric("📊 Puntaje promedio", f"{score_stats['mean']:.2f}")
     
     # Tabla de preview
     if not df_preview.empty:
@@ -1016,28 +1147,23 @@ def render_pdf_export_page(processor):
         preview_columns.extend(selected_additional_columns)
         preview_columns.append('Puntaje')
         
-        preview_columns = [col for col in preview_columns if col in df_preview.columns]
-        
-        # Crear DataFrame para mostrar con formato
-        display_df = df_preview[preview_columns].copy()
-        display_df['Puntaje'] = display_df['Puntaje'].apply(lambda x: f"{x:.2f}")
-
-        # Convertir 'Resultado' a string para poder agregar emojis
-        display_df['Resultado'] = display_df['Resultado'].astype(str)
-
-        # Añadir indicadores de medalla para Top 3
-        if len(display_df) >= 1:
-            display_df.iloc[0, display_df.columns.get_loc('Resultado')] = f"🥇 {display_df.iloc[0]['Resultado']}"
-        if len(display_df) >= 2:
-            display_df.iloc[1, display_df.columns.get_loc('Resultado')] = f"🥈 {display_df.iloc[1]['Resultado']}"
-        if len(display_df) >= 3:
-            display_df.iloc[2, display_df.columns.get_loc('Resultado')] = f"🥉 {display_df.iloc[2]['Resultado']}"
+        # Conservar el orden solicitado, solo con las columnas existentes
+        preview_columns = pd.Index(preview_columns).intersection(df_preview.columns, sort=False)
         
+        # Crear DataFrame para mostrar: proyección de las columnas, reconstruyendo
+        # solo 'Resultado' (como string, con medallas para el Top 3)
+        medals = np.array(['🥇 ', '🥈 ', '🥉 '] + [''] * max(len(df_preview) - 3, 0))[:len(df_preview)]
+        display_df = df_preview[preview_columns].assign(
+            Resultado=medals + df_preview['Resultado'].astype(str)
+        )
+
+        # El puntaje se envía numérico y lo formatea el navegador, sin convertir cada celda a texto
         st.dataframe(
             display_df,
             use_container_width=True,
             height=400,
-            hide_index=True
+            hide_index=True,
+            column_config={'Puntaje': st.column_config.NumberColumn(format="%.2f")}
         )
     else:
         st.warning("⚠️ No hay datos disponibles con los filtros seleccionados.")
@@ -1062,42 +1188,37 @@ def render_pdf_export_page(processor):
         st.write("")  # Espaciado
         st.write("")  # Espaciado
         
-        if st.button("📄 Generar PDF", type="primary", use_container_width=True):
-            if df_preview.empty:
-                st.error("❌ No hay datos para exportar con los filtros seleccionados.")
-            else:
-                try:
-                    with st.spinner("Generando PDF... Por favor espere."):
-                        # Generar PDF
-                        pdf_buffer = processor.export_to_pdf(
-                            top_n=top_n,
-                            filter_by_eje=filter_by_eje,
-                            selected_columns=selected_additional_columns
-                        )
-                        
-                        # Generar nombre de archivo
-                        filename = f"ranking_top_{top_n}"
-                        if filter_by_eje:
-                            filename += f"_{filter_by_eje}"
-                        filename += ".pdf"
-                        
-                        # Botón de descarga
-                        st.success("✅ PDF generado exitosamente!")
-                        
-                        st.download_button(
-                            label="⬇️ Descargar PDF",
-                            data=pdf_buffer,
-                            file_name=filename,
-                            mime="application/pdf",
-                            type="primary",
-                            use_container_width=True
-                        )
-                        
-                        st.balloons()
-                        
-                except Exception as e:
-                    st.error(f"❌ Error al generar el PDF: {str(e)}")
-                    st.exception(e)
+        if df_preview.empty:
+            st.error("❌ No hay datos para exportar con los filtros seleccionados.")
+        elif importlib.util.find_spec("reportlab") is None:
+            # El PDF se genera fuera de la ejecución del script, donde un error solo se
+            # vería como un fallo genérico de descarga; se comprueba aquí sin importar ReportLab
+            st.error("❌ Error al generar el PDF: la librería ReportLab no está instalada (pip install reportlab).")
+        else:
+            # Generar nombre de archivo
+            filename = f"ranking_top_{top_n}"
+            if filter_by_eje:
+                filename += f"_{filter_by_eje}"
+            filename += ".pdf"
+
+            def build_pdf():
+                return processor.export_to_pdf(
+                    top_n=top_n,
+                    filter_by_eje=filter_by_eje,
+                    selected_columns=selected_additional_columns
+                ).getvalue()
+
+            # El PDF se genera recién al pulsar el botón (en un hilo aparte) y sus
+            # bytes no quedan retenidos en la sesión entre recargas
+            st.download_button(
+                label="📄 Generar y Descargar PDF",
+                data=build_pdf,
+                file_name=filename,
+                mime="application/pdf",
+                type="primary",
+                use_container_width=True,
+                on_click="ignore"
+            )
     
     # Información adicional
     st.markdown("---")
@@ -1135,6 +1256,51 @@ def render_pdf_export_page(processor):
         - Para diplomas o certificados de reconocimiento
         """)
 
+@st.cache_data(show_spinner=False, ttl=60)
+def _list_photos(photos_dir):
+    """Imágenes del directorio como tuplas (ruta, tamaño en bytes, extensión, mtime), ordenadas por nombre"""
+    images = []
+
+    # Una sola lectura del directorio; scandir ya trae el tamaño de cada archivo
+    with os.scandir(photos_dir) as entries:
+        for entry in entries:
+            suffix = os.path.splitext(entry.name)[1]
+            if suffix.lower() in IMAGE_EXTENSIONS and entry.is_file():
+                stat = entry.stat()
+                images.append((entry.path, stat.st_size, suffix, stat.st_mtime))
+
+    images.sort()
+    return images
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _thumbnail(img_path, mtime, width):
+    """Miniatura WEBP de una imagen, redimensionada al ancho de visualización"""
+    from PIL import Image as PILImage, ImageOps
+
+    with PILImage.open(img_path) as img:
+        # Aplicar la orientación EXIF (fotos de cámara o celular): el WEBP no la conserva
+        img = ImageOps.exif_transpose(img)
+        img.thumbnail((width, width * 2), PILImage.Resampling.LANCZOS)
+        if img.mode not in ('RGB', 'RGBA'):
+            img = img.convert('RGBA')
+        buffer = io.BytesIO()
+        img.save(buffer, 'WEBP', quality=80)
+    return buffer.getvalue()
+
+def _gallery_image(img_path, suffix, mtime, width):
+    """Imagen a mostrar en la galería: miniatura en caché (los GIF se muestran tal cual para conservar la animación)"""
+    if suffix.lower() == '.gif':
+        return img_path
+    return _thumbnail(img_path, mtime, width)
+
+def _format_file_size(file_size):
+    """Tamaño de archivo legible en KB o MB"""
+    file_size_kb = file_size / 1024
+
+    if file_size_kb < 1024:
+        return f"{file_size_kb:.2f} KB"
+    return f"{file_size_kb/1024:.2f} MB"
+
 def render_gallery_page():
     """Renderiza la página de galería de fotos"""
 
@@ -1154,23 +1320,23 @@ def render_gallery_page():
         st.error("❌ No se encontró el directorio 'Photos'. Por favor, cree la carpeta y agregue imágenes.")
         return
 
-    # Obtener todas las imágenes del directorio
-    image_extensions = ['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp']
-    images = []
-
-    for ext in image_extensions:
-        images.extend(list(photos_dir.glob(f'*{ext}')))
-        images.extend(list(photos_dir.glob(f'*{ext.upper()}')))
-
-    # Ordenar imágenes por nombre
-    images = sorted(set(images))
+    # Obtener todas las imágenes del directorio (listado y tamaños en caché)
+    images = _list_photos(str(photos_dir))
 
     if not images:
         st.warning("⚠️ No se encontraron imágenes en el directorio 'Photos'. Por favor, agregue archivos de imagen (PNG, JPG, etc.).")
         return
 
     # Mostrar contador de imágenes
-    st.info(f"📊 Total de imágenes: **{len(images)}**")
+    col1, col2 = st.columns([4, 1])
+
+    with col1:
+        st.info(f"📊 Total de imágenes: **{len(images)}**")
+
+    with col2:
+        if st.button("🔄 Actualizar", use_container_width=True, help="Volver a leer la carpeta 'Photos'"):
+            _list_photos.clear()
+            st.rerun()
 
     st.markdown("---")
 
@@ -1196,6 +1362,17 @@ def render_gallery_page():
 
     st.markdown("---")
 
+    # Ancho de las miniaturas según el número de columnas (o la vista de lista)
+    thumb_width = max(400, 1200 // columns_per_row) if view_mode == "Galería" else 800
+
+    # Preparar todas las miniaturas en paralelo antes de renderizar; Pillow libera
+    # el GIL al decodificar, así que las imágenes aún no cacheadas se procesan a la vez
+    with ThreadPoolExecutor(max_workers=min(len(images), os.cpu_count() or 1)) as executor:
+        thumbnails = list(executor.map(
+            lambda image: _gallery_image(image[0], image[2], image[3], thumb_width),
+            images
+        ))
+
     # Modo de galería (grid)
     if view_mode == "Galería":
         # Calcular el número de filas necesarias
@@ -1207,67 +1384,53 @@ def render_gallery_page():
             for col_idx in range(columns_per_row):
                 if idx < len(images):
                     with cols[col_idx]:
-                        img_path = images[idx]
+                        img_path, file_size, suffix, _ = images[idx]
+                        img_name = os.path.basename(img_path)
 
                         # Mostrar la imagen
                         st.image(
-                            str(img_path),
+                            thumbnails[idx],
                             use_container_width=True,
-                            caption=img_path.name
+                            caption=img_name
                         )
 
                         # Información adicional en un expander
                         with st.expander("ℹ️ Información"):
-                            file_size = img_path.stat().st_size
-                            file_size_kb = file_size / 1024
-
-                            if file_size_kb < 1024:
-                                size_str = f"{file_size_kb:.2f} KB"
-                            else:
-                                size_str = f"{file_size_kb/1024:.2f} MB"
-
-                            st.write(f"**Nombre:** {img_path.name}")
-                            st.write(f"**Tamaño:** {size_str}")
-                            st.write(f"**Formato:** {img_path.suffix.upper()[1:]}")
+                            st.write(f"**Nombre:** {img_name}")
+                            st.write(f"**Tamaño:** {_format_file_size(file_size)}")
+                            st.write(f"**Formato:** {suffix.upper()[1:]}")
 
                     idx += 1
 
     # Modo de lista detallada
     else:
-        for idx, img_path in enumerate(images, 1):
-            st.markdown(f"### 🖼️ Imagen {idx}: {img_path.name}")
+        for idx, (img_path, file_size, suffix, _) in enumerate(images, 1):
+            img_name = os.path.basename(img_path)
+            st.markdown(f"### 🖼️ Imagen {idx}: {img_name}")
 
             col1, col2 = st.columns([2, 1])
 
             with col1:
                 st.image(
-                    str(img_path),
+                    thumbnails[idx - 1],
                     use_container_width=True
                 )
 
             with col2:
-                file_size = img_path.stat().st_size
-                file_size_kb = file_size / 1024
-
-                if file_size_kb < 1024:
-                    size_str = f"{file_size_kb:.2f} KB"
-                else:
-                    size_str = f"{file_size_kb/1024:.2f} MB"
-
                 st.markdown("**Detalles:**")
-                st.write(f"📁 **Nombre:** {img_path.name}")
-                st.write(f"📊 **Tamaño:** {size_str}")
-                st.write(f"🎨 **Formato:** {img_path.suffix.upper()[1:]}")
-
-                # Botón de descarga (opcional)
-                with open(img_path, "rb") as file:
-                    st.download_button(
-                        label="⬇️ Descargar",
-                        data=file,
-                        file_name=img_path.name,
-                        mime=f"image/{img_path.suffix[1:]}",
-                        use_container_width=True
-                    )
+                st.write(f"📁 **Nombre:** {img_name}")
+                st.write(f"📊 **Tamaño:** {_format_file_size(file_size)}")
+                st.write(f"🎨 **Formato:** {suffix.upper()[1:]}")
+
+                # Botón de descarga (opcional); el archivo se lee solo al pulsarlo
+                st.download_button(
+                    label="⬇️ Descargar",
+                    data=Path(img_path).read_bytes,
+                    file_name=img_name,
+                    mime=f"image/{suffix[1:]}",
+                    use_container_width=True,
+                    on_click="ignore"
+                )
 
             if idx < len(images):
                 st.markdown("---")
@@ -1288,7 +1451,7 @@ def render_gallery_page():
 
         **Agregar nuevas imágenes:**
         1. Coloque sus imágenes en la carpeta `Photos` del proyecto
-        2. Recargue la página para ver las nuevas imágenes
+        2. Pulse "🔄 Actualizar" (o espere un minuto) para ver las nuevas imágenes
 
         **Descargar imágenes:**
         - Use el modo "Lista detallada" para descargar imágenes individuales
@@ -5,18 +5,17 @@ Maneja la carga, validación y procesamiento del archivo CSV
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional
 import streamlit as st
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
 from datetime import datetime
+from functools import cached_property, lru_cache
 import io
 import os
 
+if TYPE_CHECKING:
+    # ReportLab se importa solo al generar un PDF; aquí solo para las anotaciones
+    from reportlab.lib.styles import ParagraphStyle
+
 # Mapeo de países a códigos ISO de 2 letras
 COUNTRY_TO_CODE = {
     'Perú': 'PE',
@@ -76,6 +75,10 @@ COUNTRY_TO_CODE = {
     'South Africa': 'ZA'
 }
 
+# Claves en minúsculas precalculadas: búsqueda exacta por hash y lista para coincidencias parciales
+_COUNTRY_LOWER = {key.lower(): code for key, code in COUNTRY_TO_CODE.items()}
+_COUNTRY_ITEMS_LOWER = list(_COUNTRY_LOWER.items())
+
 def get_country_code(country_name: str) -> str:
     """
     Obtiene el código ISO de 2 letras para un país dado
@@ -90,20 +93,177 @@ def get_country_code(country_name: str) -> str:
         return ''
     
     # Limpiar nombre del país
-    country_clean = str(country_name).strip()
+    country_clean = str(country_name).strip().lower()
     
     # Buscar en el diccionario (case-insensitive)
-    for key, code in COUNTRY_TO_CODE.items():
-        if key.lower() == country_clean.lower():
-            return code
+    code = _COUNTRY_LOWER.get(country_clean)
+    if code:
+        return code
     
     # Si no se encuentra, intentar buscar parcialmente
-    for key, code in COUNTRY_TO_CODE.items():
-        if key.lower() in country_clean.lower() or country_clean.lower() in key.lower():
+    for key, code in _COUNTRY_ITEMS_LOWER:
+        if key in country_clean or country_clean in key:
             return code
     
     return ''  # No se encontró código
 
+def top_n_positions(values: np.ndarray, n: int) -> np.ndarray:
+    """
+    Obtiene las posiciones de los n valores más altos, ordenadas de mayor a menor
+
+    Equivale a DataFrame.nlargest(n, keep='first') (los empates se resuelven por
+    orden de aparición) pero con selección parcial O(N) en lugar de ordenar.
+
+    Args:
+        values: Arreglo numérico sin valores NaN
+        n: Cantidad de posiciones a devolver
+
+    Returns:
+        Arreglo de posiciones enteras
+    """
+    n = min(n, len(values))
+    if n <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    # Valor del n-ésimo mayor: entran todos los mayores y los primeros empates
+    kth = np.partition(values, len(values) - n)[len(values) - n]
+    above = np.flatnonzero(values > kth)
+    ties = np.flatnonzero(values == kth)[:n - len(above)]
+    top = np.concatenate([above, ties])
+    return top[np.lexsort((top, -values[top]))]
+
+# Tipos declarados al leer el CSV. Las columnas de puntaje se leen como texto porque el
+# lector de Arrow no convierte enteros con nulos cuando se pasa un dtype por columna;
+# _clean_data las convierte a número con errors='coerce'
+CSV_DTYPES = {
+    'Eje': 'category',
+    'País': 'category',
+    'Institución': 'category',
+    'Presentó': 'category',
+    'Ponencia': 'category',
+    'Sitio': 'category',
+    'Evaluar': 'category',
+    'Calificativo': 'str',
+    'Puntaje': 'str',
+    'Resultado': 'str',
+}
+
+@lru_cache(maxsize=1)
+def _get_pdf_styles() -> Dict[str, "ParagraphStyle"]:
+    """Estilos de párrafo del reporte PDF, creados una sola vez y compartidos entre exportaciones"""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_CENTER
+
+    styles = getSampleStyleSheet()
+    return {
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=18,
+            textColor=colors.HexColor('#1f77b4'),
+            spaceAfter=20,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold'
+        ),
+        'subtitle': ParagraphStyle(
+            'CustomSubtitle',
+            parent=styles['Normal'],
+            fontSize=12,
+            textColor=colors.HexColor('#666666'),
+            spaceAfter=10,
+            alignment=TA_CENTER
+        ),
+        'summary': ParagraphStyle(
+            'Summary',
+            parent=styles['Normal'],
+            fontSize=10,
+            spaceAfter=10
+        ),
+        'text': ParagraphStyle(
+            'CellText',
+            parent=styles['Normal'],
+            fontSize=7.5,
+            leading=10,
+            wordWrap='CJK',
+            splitLongWords=True,
+            breakLongWords=True
+        ),
+        'country': ParagraphStyle(
+            'CountryCode',
+            parent=styles['Normal'],
+            fontSize=7,
+            textColor=colors.HexColor('#FFFFFF'),
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold'
+        ),
+        'comision_title': ParagraphStyle(
+            'ComisionTitle',
+            parent=styles['Heading2'],
+            fontSize=12,
+            textColor=colors.HexColor('#1f77b4'),
+            spaceAfter=10,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold'
+        ),
+        'integrante': ParagraphStyle(
+            'IntegranteStyle',
+            parent=styles['Normal'],
+            fontSize=9,
+            alignment=TA_CENTER,
+            spaceAfter=4
+        ),
+        'error': ParagraphStyle(
+            'ErrorStyle',
+            parent=styles['Normal'],
+            fontSize=8,
+            textColor=colors.HexColor('#999999'),
+            alignment=TA_CENTER
+        ),
+        'footer': ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=8,
+            textColor=colors.HexColor('#999999'),
+            alignment=TA_CENTER
+        )
+    }
+
+@lru_cache(maxsize=8)
+def _image_size(path: str, mtime: float) -> Tuple[int, int]:
+    """Dimensiones (ancho, alto) de una imagen; mtime forma parte de la clave de caché"""
+    from PIL import Image as PILImage
+
+    with PILImage.open(path) as img:
+        return img.size
+
+@st.cache_data(show_spinner=False)
+def _load_integrantes(path: str, mtime: float) -> List[str]:
+    """Nombres de la primera columna del Excel de integrantes, en caché por ruta y mtime"""
+    df_integrantes = pd.read_excel(path)
+    return [str(nombre) for nombre in df_integrantes.iloc[:, 0].tolist()]
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _load_clean_csv(_processor: "DataProcessor", csv_path: str, mtime: float) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    Lee, valida y limpia el CSV, en caché por ruta y fecha de modificación
+
+    Solo se conserva la última versión: el procesador ya guarda el DataFrame cargado.
+
+    Args:
+        _processor: Procesador que aporta las reglas de validación (no forma parte de la clave)
+        csv_path: Ruta del archivo CSV
+        mtime: Fecha de modificación del archivo; al cambiar se vuelve a leer
+
+    Returns:
+        Tupla (DataFrame limpio, advertencias de validación)
+    """
+    # Lector CSV de Arrow (multihilo); las columnas de baja cardinalidad se leen ya como
+    # categorías y el texto restante queda en columnas respaldadas por Arrow
+    df = pd.read_csv(csv_path, encoding='utf-8', engine='pyarrow', dtype=CSV_DTYPES)
+    load_warnings = _processor._validate_data(df)
+    return _processor._clean_data(df), load_warnings
+
 class DataProcessor:
     """Clase para procesar y validar los datos del congreso"""
     
@@ -112,102 +272,207 @@ class DataProcessor:
         self.df = None
         self.required_columns = ['Id', 'Nombres', 'Apellidos', 'Título', 'Eje', 'País']
         self.eje_values = ['E1', 'E2', 'E3', 'E4', 'E5', 'E6', 'E7']
-        
-    @st.cache_data
-    def load_data(_self) -> pd.DataFrame:
-        """Carga y valida los datos del CSV"""
+        self.category_columns = ['Eje', 'País', 'Institución', 'Origen', 'Presentó', 'Ponencia', 'Sitio']
+        self._category_codes = {}
+        self._id_index = None
+        self.evaluar_mask = None
+        self._eje_idx = {}
+        self._search_text = None
+        self._numeric_values = {}
+        self._load_warnings = []
+        self._loaded_mtime = None
+
+    @property
+    def data_version(self) -> Tuple[str, Optional[float]]:
+        """Clave (ruta, fecha de modificación) de los datos cargados actualmente, para cachés externas"""
+        return self.csv_path, self._loaded_mtime
+
+    @cached_property
+    def eje_options_with_all(self) -> Tuple[str, ...]:
+        """Opciones de eje para los selectores, con la opción Todos los ejes al inicio"""
+        return ("Todos los ejes", *self.eje_values)
+        
+    def load_data(self) -> pd.DataFrame:
+        """Carga y valida los datos del CSV (se vuelve a leer solo si el archivo cambió)"""
         try:
-            _self.df = pd.read_csv(_self.csv_path, encoding='utf-8')
-            _self._validate_data()
-            _self._clean_data()
-            return _self.df
+            mtime = os.path.getmtime(self.csv_path)
+            if self.df is None or mtime != self._loaded_mtime:
+                # Los datos y sus índices se publican juntos y solo si todo tuvo éxito;
+                # si algo falla, la próxima llamada vuelve a intentar la carga
+                df, load_warnings = _load_clean_csv(self, self.csv_path, mtime)
+                self._build_indexes(df)
+                self._load_warnings = load_warnings
+                self._loaded_mtime = mtime
+
+            # Las advertencias de validación se muestran en cada ejecución, aunque los
+            # datos vengan de la caché
+            for warning in self._load_warnings:
+                st.warning(warning)
+            return self.df
         except FileNotFoundError:
-            st.error(f"❌ No se encontró el archivo {_self.csv_path}")
+            st.error(f"❌ No se encontró el archivo {self.csv_path}")
             return pd.DataFrame()
         except Exception as e:
             st.error(f"❌ Error al cargar los datos: {str(e)}")
             return pd.DataFrame()
     
-    def _validate_data(self):
-        """Valida la estructura de los datos"""
-        if self.df is None:
+    def _validate_data(self, df: pd.DataFrame) -> List[str]:
+        """Valida la estructura de los datos y devuelve las advertencias encontradas"""
+        if df is None:
             raise ValueError("No hay datos cargados")
         
         # Verificar columnas requeridas
-        missing_cols = [col for col in self.required_columns if col not in self.df.columns]
+        missing_cols = [col for col in self.required_columns if col not in df.columns]
         if missing_cols:
             raise ValueError(f"Faltan columnas requeridas: {missing_cols}")
         
         # Verificar valores de Eje
-        invalid_ejes = self.df[~self.df['Eje'].isin(self.eje_values + [np.nan])]['Eje'].unique()
+        load_warnings = []
+        invalid_ejes = df[~df['Eje'].isin(self.eje_values + [np.nan])]['Eje'].unique()
         if len(invalid_ejes) > 0:
-            st.warning(f"⚠️ Valores de Eje no válidos encontrados: {invalid_ejes}")
+            load_warnings.append(f"⚠️ Valores de Eje no válidos encontrados: {list(invalid_ejes)}")
+        return load_warnings
     
-    def _clean_data(self):
-        """Limpia y prepara los datos"""
-        if self.df is None:
-            return
-
-        # Limpiar espacios en blanco
-        string_columns = self.df.select_dtypes(include=['object']).columns
+    def _clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Limpia y prepara los datos; devuelve el DataFrame limpio sin modificar el estado del procesador"""
+        # Limpiar espacios en blanco y reemplazar valores vacíos en una sola pasada por
+        # columna de texto; .str.strip() es vectorizado y conserva los nulos, y las
+        # columnas numéricas ya no se recorren ni se copian
+        string_columns = df.select_dtypes(include=['object']).columns
         for col in string_columns:
-            self.df[col] = self.df[col].astype(str).str.strip()
+            stripped = df[col].str.strip()
+            df[col] = stripped.mask(stripped.isin(['', 'nan', 'None']))
 
-        # Reemplazar valores vacíos
-        self.df = self.df.replace(['', 'nan', 'None'], np.nan)
+        # Las columnas leídas como categorías se limpian sobre sus categorías distintas
+        for col in df.select_dtypes(include=['category']).columns:
+            df[col] = self._recode_categories(df[col], self._strip_empty)
 
         # Crear nombre completo para análisis de duplicados
-        self.df['Nombre_Completo'] = self.df['Nombres'].astype(str) + ' ' + self.df['Apellidos'].astype(str)
+        df['Nombre_Completo'] = df['Nombres'].astype(str) + ' ' + df['Apellidos'].astype(str)
+
+        # Verificar si existe columna Evaluar (leída como categoría); se normaliza una sola
+        # vez a mayúsculas para que los filtros comparen códigos y no cadenas
+        has_evaluar = 'Evaluar' in df.columns
+        if has_evaluar:
+            df['Evaluar'] = self._recode_categories(df['Evaluar'], lambda cats: cats.str.upper())
 
-        # Verificar si existe columna Evaluar
-        has_evaluar = 'Evaluar' in self.df.columns
+        # Registros a evaluar, calculado una sola vez (todos si no existe la columna Evaluar)
+        if has_evaluar:
+            mask_evaluar = df['Evaluar'].eq('SI').to_numpy()
+        else:
+            mask_evaluar = np.ones(len(df), dtype=bool)
 
         # Calcular dinámicamente Puntaje si existe Calificativo
-        if 'Calificativo' in self.df.columns:
+        if 'Calificativo' in df.columns:
             # Convertir a numérico, forzando errores a NaN
-            self.df['Calificativo'] = pd.to_numeric(self.df['Calificativo'], errors='coerce')
-
-            # Solo calcular Puntaje para registros con Evaluar='SI' (si la columna existe)
-            if has_evaluar:
-                # Inicializar Puntaje como NaN para todos
-                self.df['Puntaje'] = np.nan
-                # Calcular solo para los que deben ser evaluados
-                mask_evaluar = self.df['Evaluar'].str.upper() == 'SI'
-                self.df.loc[mask_evaluar, 'Puntaje'] = self.df.loc[mask_evaluar, 'Calificativo'] / 100
-            else:
-                # Si no existe la columna Evaluar, calcular para todos
-                self.df['Puntaje'] = self.df['Calificativo'] / 100
+            df['Calificativo'] = pd.to_numeric(df['Calificativo'], errors='coerce')
+
+            # Solo calcular Puntaje para registros con Evaluar='SI' (NaN para el resto)
+            calificativo = df['Calificativo'].to_numpy(dtype='float64')
+            df['Puntaje'] = np.where(mask_evaluar, calificativo / 100.0, np.nan)
 
         # Calcular dinámicamente Resultado (ranking) si existe Puntaje
-        if 'Puntaje' in self.df.columns:
+        if 'Puntaje' in df.columns:
             # Convertir a numérico, forzando errores a NaN
-            self.df['Puntaje'] = pd.to_numeric(self.df['Puntaje'], errors='coerce')
-
-            # Inicializar Resultado como NaN
-            self.df['Resultado'] = pd.NA
-
-            # Solo calcular ranking para registros con Evaluar='SI' (si la columna existe)
-            if has_evaluar:
-                mask_evaluar = self.df['Evaluar'].str.upper() == 'SI'
-                # Filtrar solo los que tienen puntaje válido y deben ser evaluados
-                mask_valid = mask_evaluar & self.df['Puntaje'].notna()
-                if mask_valid.any():
-                    # Dense ranking: sin gaps, el mejor Puntaje obtiene rank 1
-                    # Usar Int64 para permitir NaN en columnas de tipo entero
-                    self.df.loc[mask_valid, 'Resultado'] = self.df.loc[mask_valid, 'Puntaje'].rank(
-                        method='dense', ascending=False
-                    ).astype('Int64')
-            else:
-                # Si no existe la columna Evaluar, calcular ranking para todos los que tienen puntaje
-                mask_valid = self.df['Puntaje'].notna()
-                if mask_valid.any():
-                    self.df.loc[mask_valid, 'Resultado'] = self.df.loc[mask_valid, 'Puntaje'].rank(
-                        method='dense', ascending=False
-                    ).astype('Int64')
-
-            # Asegurar que Resultado sea tipo Int64
-            self.df['Resultado'] = self.df['Resultado'].astype('Int64')
+            df['Puntaje'] = pd.to_numeric(df['Puntaje'], errors='coerce')
+
+            # Solo calcular ranking para registros con Evaluar='SI' y puntaje válido;
+            # el resto queda en NaN y rank() los deja fuera del ranking
+            puntaje = df['Puntaje'].to_numpy(dtype='float64')
+            mask_valid = mask_evaluar & ~np.isnan(puntaje)
+            candidatos = pd.Series(np.where(mask_valid, puntaje, np.nan), index=df.index)
+
+            # Dense ranking: sin gaps, el mejor Puntaje obtiene rank 1
+            # Usar Int64 para permitir NaN en columnas de tipo entero
+            df['Resultado'] = candidatos.rank(method='dense', ascending=False).astype('Int64')
+
+        return df
+
+    @staticmethod
+    def _strip_empty(values: pd.Index) -> pd.Index:
+        """Quita espacios y convierte en nulos los textos vacíos o de relleno"""
+        stripped = values.str.strip()
+        return stripped.where(~stripped.isin(['', 'nan', 'None']))
+
+    @staticmethod
+    def _recode_categories(values: pd.Series, transform) -> pd.Series:
+        """
+        Aplica una transformación de texto a las categorías de una columna categórica
+
+        Las categorías que quedan iguales se fusionan y las que quedan nulas pasan a NaN;
+        el resultado mantiene las categorías ordenadas, como astype('category').
+        """
+        categories = values.cat.categories
+        new_categories = transform(categories)
+        if new_categories.equals(categories):
+            return values
+
+        # Código nuevo de cada categoría antigua (-1 si queda nula), en orden alfabético
+        category_codes, uniques = pd.factorize(new_categories, sort=True)
+        codes = values.cat.codes.to_numpy()
+        new_codes = np.where(codes >= 0, category_codes[codes], -1)
+        return pd.Series(
+            pd.Categorical.from_codes(new_codes, categories=uniques),
+            index=values.index, name=values.name
+        )
+
+    def _build_indexes(self, df: pd.DataFrame):
+        """
+        Precalcula estructuras auxiliares para acelerar las consultas y publica df con ellas
+
+        Todo se calcula antes de asignar, así un error deja intactos los datos anteriores.
+        """
+        # Códigos enteros por columna categórica para conteos con np.bincount
+        category_codes = {}
+        for col in self.category_columns:
+            if col in df.columns:
+                codes, categories = pd.factorize(df[col])
+                category_codes[col] = (codes, categories)
+
+        # Posiciones de las filas de cada eje para conteos sin groupby
+        eje_idx = {
+            eje: np.flatnonzero((df['Eje'] == eje).to_numpy())
+            for eje in self.eje_values
+        }
+
+        # Índice por Id para recuperar registros sin recorrer toda la columna
+        id_index = pd.Index(df['Id'])
+
+        # Texto de búsqueda por registro, en minúsculas, con los campos separados
+        # por un carácter de control para que una coincidencia no cruce campos
+        search_parts = [self._lowercase_text(df[col]) for col in ['Título', 'Nombres', 'Apellidos', 'Institución']]
+        search_text = search_parts[0].str.cat(search_parts[1:], sep='\x1f').to_numpy(dtype=str)
+
+        # Puntaje y Resultado como float64 con NaN para los filtros por rango; Resultado
+        # sigue siendo Int64 en el DataFrame para mostrarse como entero
+        numeric_values = {
+            col: df[col].to_numpy(dtype='float64', na_value=np.nan)
+            for col in ['Puntaje', 'Resultado'] if col in df.columns
+        }
+
+        # Registros que deben ser evaluados (todos si no existe la columna Evaluar)
+        if 'Evaluar' in df.columns:
+            evaluar_mask = df['Evaluar'].eq('SI')
+        else:
+            evaluar_mask = pd.Series(True, index=df.index)
+
+        self.df = df
+        self._category_codes = category_codes
+        self._eje_idx = eje_idx
+        self._id_index = id_index
+        self._search_text = search_text
+        self._numeric_values = numeric_values
+        self.evaluar_mask = evaluar_mask
     
+    @staticmethod
+    def _lowercase_text(values: pd.Series) -> pd.Series:
+        """Columna de texto en minúsculas, con cadena vacía para los nulos"""
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # En columnas categóricas solo se pasa a minúsculas cada categoría distinta
+            lowered = np.append(values.cat.categories.str.lower().to_numpy(dtype=object), '')
+            return pd.Series(lowered[values.cat.codes.to_numpy()], index=values.index)
+        return values.astype('string').fillna('').str.lower()
+
     def get_basic_stats(self) -> Dict:
         """Obtiene estadísticas básicas de los datos"""
         if self.df is None or self.df.empty:
@@ -217,28 +482,55 @@ class DataProcessor:
             'total_ponencias': len(self.df),
             'total_paises': self.df['País'].nunique(),
             'total_instituciones': self.df['Institución'].nunique(),
-            'distribucion_eje': self.df['Eje'].value_counts().to_dict(),
-            'paises_top': self.df['País'].value_counts().head(5).to_dict(),
-            'instituciones_top': self.df['Institución'].value_counts().head(5).to_dict(),
-            'presento_stats': self.df['Presentó'].value_counts().to_dict(),
-            'ponencia_stats': self.df['Ponencia'].value_counts().to_dict()
+            'distribucion_eje': {eje: n for eje, n in self.count_by_eje().items() if n > 0},
+            'paises_top': self.get_top_counts('País', 5).to_dict(),
+            'instituciones_top': self.get_top_counts('Institución', 5).to_dict(),
+            'presento_stats': self.get_top_counts('Presentó', len(self.df)).to_dict(),
+            'ponencia_stats': self.get_top_counts('Ponencia', len(self.df)).to_dict()
         }
         return stats
     
+    def count_by_eje(self, mask: Optional[np.ndarray] = None) -> Dict[str, int]:
+        """
+        Cuenta registros por eje usando las posiciones precalculadas de cada eje
+
+        Args:
+            mask: Máscara booleana alineada con self.df para contar solo un subconjunto (opcional)
+
+        Returns:
+            Diccionario {eje: cantidad} con todos los ejes válidos (incluye ceros)
+        """
+        if mask is None:
+            return {eje: len(idx) for eje, idx in self._eje_idx.items()}
+        return {eje: int(mask[idx].sum()) for eje, idx in self._eje_idx.items()}
+    
     def get_eje_analysis(self) -> Dict:
         """Análisis detallado por eje temático"""
         if self.df is None or self.df.empty:
             return {}
         
+        # Conteos sobre las posiciones precalculadas de cada eje y los códigos de
+        # País/Institución, sin volver a recorrer el DataFrame por cada eje
+        pais_codes, pais_names = self._category_codes['País']
+        inst_codes, _ = self._category_codes['Institución']
+        
         eje_stats = {}
         for eje in self.eje_values:
-            eje_data = self.df[self.df['Eje'] == eje]
+            positions = self._eje_idx[eje]
+            codes = pais_codes[positions]
+            
+            # Países del eje por frecuencia; los empates mantienen el orden de aparición
+            local_codes, uniques = pd.factorize(codes[codes >= 0])
+            counts = np.bincount(local_codes, minlength=len(uniques))
+            order = np.argsort(-counts, kind='stable')
+            
+            eje_inst = inst_codes[positions]
             eje_stats[eje] = {
-                'total': len(eje_data),
-                'porcentaje': round(len(eje_data) / len(self.df) * 100, 2),
-                'paises': eje_data['País'].nunique(),
-                'instituciones': eje_data['Institución'].nunique(),
-                'paises_list': eje_data['País'].value_counts().to_dict()
+                'total': len(positions),
+                'porcentaje': round(len(positions) / len(self.df) * 100, 2),
+                'paises': len(uniques),
+                'instituciones': len(np.unique(eje_inst[eje_inst >= 0])),
+                'paises_list': dict(zip(pais_names[uniques[order]], counts[order].tolist()))
             }
         
         return eje_stats
@@ -249,125 +541,159 @@ class DataProcessor:
             return {}
         
         # Detectar duplicados por nombre completo
-        duplicates = self.df[self.df.duplicated(subset=['Nombre_Completo'], keep=False)]
+        dup_mask = self.df.duplicated(subset=['Nombre_Completo'], keep=False)
+        duplicates = self.df[dup_mask]
         
         if duplicates.empty:
             return {'total_duplicados': 0, 'registros': [], 'por_eje': {}}
         
-        # Agrupar duplicados
-        duplicate_groups = duplicates.groupby('Nombre_Completo')
+        # Agrupar duplicados: un único ordenamiento estable por nombre (conserva el
+        # orden original dentro de cada grupo) y corte en los cambios de nombre
+        grouped = duplicates[duplicates['Nombre_Completo'].notna().to_numpy()]
+        names = grouped['Nombre_Completo'].to_numpy(dtype=str)
+        order = np.argsort(names, kind='stable')
+        names = names[order]
+        boundaries = np.flatnonzero(names[1:] != names[:-1]) + 1
+        group_names = names[np.concatenate(([0], boundaries))] if len(names) else names
+        group_values = {
+            col: np.split(grouped[col].to_numpy()[order], boundaries)
+            for col in ['Eje', 'País', 'Institución', 'Id']
+        }
         
         duplicate_analysis = {
-            'total_duplicados': len(duplicate_groups),
+            'total_duplicados': len(group_names),
             'total_registros_duplicados': len(duplicates),
             'registros': [],
             'por_eje': {}
         }
         
         # Análisis por eje de duplicados
-        for eje in self.eje_values:
-            eje_duplicates = duplicates[duplicates['Eje'] == eje]
-            duplicate_analysis['por_eje'][eje] = len(eje_duplicates)
+        duplicate_analysis['por_eje'] = self.count_by_eje(dup_mask.to_numpy())
         
         # Detalles de cada grupo de duplicados
-        for name, group in duplicate_groups:
+        for name, ejes, paises, instituciones, ids in zip(
+            group_names.tolist(), group_values['Eje'], group_values['País'],
+            group_values['Institución'], group_values['Id']
+        ):
             duplicate_analysis['registros'].append({
                 'nombre': name,
-                'cantidad': len(group),
-                'ejes': group['Eje'].tolist(),
-                'paises': group['País'].tolist(),
-                'instituciones': group['Institución'].tolist(),
-                'ids': group['Id'].tolist()
+                'cantidad': len(ids),
+                'ejes': ejes.tolist(),
+                'paises': paises.tolist(),
+                'instituciones': instituciones.tolist(),
+                'ids': ids.tolist()
             })
         
         return duplicate_analysis
     
+    def get_records_by_ids(self, ids: List) -> pd.DataFrame:
+        """Obtiene los registros con los Ids indicados usando el índice precalculado"""
+        if self.df is None or self.df.empty:
+            return pd.DataFrame()
+
+        positions = self._id_index.get_indexer_for(ids)
+        return self.df.iloc[positions[positions >= 0]]
+    
     def filter_data(self, filters: Dict) -> pd.DataFrame:
         """Aplica filtros a los datos"""
         if self.df is None or self.df.empty:
             return pd.DataFrame()
 
-        filtered_df = self.df.copy()
-
-        # Filtro por Eje
-        if 'eje' in filters and filters['eje']:
-            if isinstance(filters['eje'], list):
-                filtered_df = filtered_df[filtered_df['Eje'].isin(filters['eje'])]
-            else:
-                filtered_df = filtered_df[filtered_df['Eje'] == filters['eje']]
-
-        # Filtro por País
-        if 'pais' in filters and filters['pais']:
-            if isinstance(filters['pais'], list):
-                filtered_df = filtered_df[filtered_df['País'].isin(filters['pais'])]
-            else:
-                filtered_df = filtered_df[filtered_df['País'] == filters['pais']]
-
-        # Filtro por Institución
-        if 'institucion' in filters and filters['institucion']:
-            if isinstance(filters['institucion'], list):
-                filtered_df = filtered_df[filtered_df['Institución'].isin(filters['institucion'])]
-            else:
-                filtered_df = filtered_df[filtered_df['Institución'] == filters['institucion']]
-
-        # Filtro por Presentó
-        if 'presento' in filters and filters['presento']:
-            if isinstance(filters['presento'], list):
-                filtered_df = filtered_df[filtered_df['Presentó'].isin(filters['presento'])]
-            else:
-                filtered_df = filtered_df[filtered_df['Presentó'] == filters['presento']]
-
-        # Filtro por Ponencia
-        if 'ponencia' in filters and filters['ponencia']:
-            if isinstance(filters['ponencia'], list):
-                filtered_df = filtered_df[filtered_df['Ponencia'].isin(filters['ponencia'])]
-            else:
-                filtered_df = filtered_df[filtered_df['Ponencia'] == filters['ponencia']]
-
-        # Filtro por Sitio
-        if 'sitio' in filters and filters['sitio']:
-            if isinstance(filters['sitio'], list):
-                filtered_df = filtered_df[filtered_df['Sitio'].isin(filters['sitio'])]
-            else:
-                filtered_df = filtered_df[filtered_df['Sitio'] == filters['sitio']]
+        # Sin filtros activos se devuelve el DataFrame cargado tal cual (de solo lectura),
+        # sin construir la máscara ni copiar las filas
+        if not any(filters.values()):
+            return self.df
+
+        # Se combina una sola máscara booleana y se filtra una única vez al final
+        mask = np.ones(len(self.df), dtype=bool)
+
+        # Filtros por valor (lista de valores permitidos o un valor único)
+        column_filters = [
+            ('eje', 'Eje'),
+            ('pais', 'País'),
+            ('institucion', 'Institución'),
+            ('presento', 'Presentó'),
+            ('ponencia', 'Ponencia'),
+            ('sitio', 'Sitio')
+        ]
+        for key, col in column_filters:
+            if key in filters and filters[key]:
+                if isinstance(filters[key], list):
+                    mask &= self.df[col].isin(filters[key]).to_numpy()
+                else:
+                    mask &= (self.df[col] == filters[key]).to_numpy()
 
         # Búsqueda de texto
         if 'texto' in filters and filters['texto']:
             texto = filters['texto'].lower()
-            mask = (
-                filtered_df['Título'].str.lower().str.contains(texto, na=False) |
-                filtered_df['Nombres'].str.lower().str.contains(texto, na=False) |
-                filtered_df['Apellidos'].str.lower().str.contains(texto, na=False) |
-                filtered_df['Institución'].str.lower().str.contains(texto, na=False)
-            )
-            filtered_df = filtered_df[mask]
-
-        # Filtro por rango de Puntaje
-        if 'puntaje_range' in filters and filters['puntaje_range'] is not None:
-            if 'Puntaje' in filtered_df.columns:
-                min_puntaje, max_puntaje = filters['puntaje_range']
-                filtered_df = filtered_df[
-                    (filtered_df['Puntaje'] >= min_puntaje) &
-                    (filtered_df['Puntaje'] <= max_puntaje)
-                ]
-
-        # Filtro por rango de Resultado
-        if 'resultado_range' in filters and filters['resultado_range'] is not None:
-            if 'Resultado' in filtered_df.columns:
-                min_resultado, max_resultado = filters['resultado_range']
-                filtered_df = filtered_df[
-                    (filtered_df['Resultado'] >= min_resultado) &
-                    (filtered_df['Resultado'] <= max_resultado)
-                ]
+            mask &= np.char.find(self._search_text, texto) >= 0
+
+        # Filtros por rango de Puntaje y de Resultado; se comparan los arreglos float64
+        # precalculados, donde los nulos son NaN y quedan fuera sin máscaras de nulos
+        range_filters = [
+            ('puntaje_range', 'Puntaje'),
+            ('resultado_range', 'Resultado')
+        ]
+        for key, col in range_filters:
+            if key in filters and filters[key] is not None and col in self._numeric_values:
+                min_value, max_value = filters[key]
+                values = self._numeric_values[col]
+                mask &= (values >= min_value) & (values <= max_value)
+
+        filtered_df = self.df[mask]
 
         return filtered_df
     
+    def get_top_counts(self, column: str, top_n: int) -> pd.Series:
+        """Obtiene los top N valores más frecuentes de una columna (equivalente a value_counts().head())"""
+        if self.df is None or self.df.empty or column not in self.df.columns:
+            return pd.Series(dtype='int64')
+
+        if column not in self._category_codes:
+            return self.df[column].value_counts().head(top_n)
+
+        codes, categories = self._category_codes[column]
+        counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+
+        top = top_n_positions(counts, top_n)
+        return pd.Series(counts[top], index=pd.Index(categories[top], name=column), name='count')
+    
+    def get_ranking_positions(self, top_n: int, filter_by_eje: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Obtiene las posiciones de las ponencias que compiten en el ranking y de las top N
+
+        Args:
+            top_n: Número de mejores ponencias a seleccionar
+            filter_by_eje: Eje a filtrar (se ignora si no es uno de los ejes válidos)
+
+        Returns:
+            Tupla (candidatas, top): posiciones de las ponencias con Evaluar='SI' y puntaje
+            válido, y de las top N entre ellas, ordenadas de mayor a menor puntaje
+        """
+        # Una sola máscara combinada (Evaluar='SI', puntaje válido y eje) sin copiar el DataFrame
+        puntajes = self._numeric_values['Puntaje']
+        mask = self.evaluar_mask.to_numpy() & ~np.isnan(puntajes)
+        if filter_by_eje in self.eje_values:
+            mask &= (self.df['Eje'] == filter_by_eje).to_numpy()
+        candidates = np.flatnonzero(mask)
+
+        # Seleccionar los top N por puntaje con selección parcial, sin ordenar todo
+        top = candidates[top_n_positions(puntajes[candidates], top_n)]
+        return candidates, top
+
     def get_unique_values(self, column: str) -> List[str]:
         """Obtiene valores únicos de una columna para filtros"""
         if self.df is None or self.df.empty or column not in self.df.columns:
             return []
-        
-        return sorted(self.df[column].dropna().unique().tolist())
+
+        values = self.df[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # En columnas categóricas basta con las categorías presentes, sin recorrer valores
+            codes = values.cat.codes.to_numpy()
+            present = np.bincount(codes[codes >= 0], minlength=len(values.cat.categories)) > 0
+            return sorted(values.cat.categories[present].tolist())
+
+        return sorted(values.dropna().unique().tolist())
     
     def export_to_excel(self, data: pd.DataFrame, filename: str = "datos_congreso.xlsx"):
         """Exporta datos a Excel"""
@@ -392,10 +718,14 @@ class DataProcessor:
                 for col_num, value in enumerate(data.columns.values):
                     worksheet.write(0, col_num, value, header_format)
                 
-                # Ajustar ancho de columnas
+                # Ajustar ancho de columnas; el ancho se limita a 50, así que basta con
+                # medir las primeras filas con .str.len() en lugar de toda la columna
+                # (una columna sin valores en la muestra, o un DataFrame vacío, mide 0)
+                sample = data.head(500)
                 for i, col in enumerate(data.columns):
+                    lengths = sample[col].astype(str).str.len()
                     max_length = max(
-                        data[col].astype(str).map(len).max(),
+                        int(lengths.max()) if lengths.notna().any() else 0,
                         len(str(col))
                     )
                     worksheet.set_column(i, i, min(max_length + 2, 50))
@@ -426,23 +756,17 @@ class DataProcessor:
         if 'Puntaje' not in self.df.columns or 'Resultado' not in self.df.columns:
             raise ValueError("Los datos deben contener columnas 'Puntaje' y 'Resultado'")
         
-        # Filtrar datos
-        df_filtered = self.df.copy()
-
-        # Solo incluir registros con Evaluar='SI' si la columna existe
-        if 'Evaluar' in df_filtered.columns:
-            df_filtered = df_filtered[df_filtered['Evaluar'].str.upper() == 'SI']
-
-        # Filtrar por eje si se especifica
-        if filter_by_eje and filter_by_eje in self.eje_values:
-            df_filtered = df_filtered[df_filtered['Eje'] == filter_by_eje]
-
-        # Filtrar solo los que tienen puntaje válido
-        df_filtered = df_filtered[df_filtered['Puntaje'].notna()]
-
-        # Ordenar por puntaje y tomar los top N
-        df_top = df_filtered.nlargest(top_n, 'Puntaje')
+        # Ponencias evaluadas (Evaluar='SI', puntaje válido y eje si se especifica) y top N
+        candidates, top = self.get_ranking_positions(top_n, filter_by_eje)
+        puntajes = self.df['Puntaje'].iloc[candidates]
+        df_top = self.df.iloc[top]
         
+        # ReportLab se importa solo al generar un PDF, no al iniciar la aplicación
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import letter, A4
+        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
+        from reportlab.lib.units import inch
+
         # Crear buffer para el PDF
         buffer = io.BytesIO()
         
@@ -454,26 +778,10 @@ class DataProcessor:
         # Contenedor para elementos del PDF
         elements = []
         
-        # Estilos
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=18,
-            textColor=colors.HexColor('#1f77b4'),
-            spaceAfter=20,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        )
-        
-        subtitle_style = ParagraphStyle(
-            'CustomSubtitle',
-            parent=styles['Normal'],
-            fontSize=12,
-            textColor=colors.HexColor('#666666'),
-            spaceAfter=10,
-            alignment=TA_CENTER
-        )
+        # Estilos (compartidos entre exportaciones)
+        pdf_styles = _get_pdf_styles()
+        title_style = pdf_styles['title']
+        subtitle_style = pdf_styles['subtitle']
         
         # Título
         title_text = f"Ranking Top {top_n} - Convención de Suelos Pucallpa 2025"
@@ -485,18 +793,13 @@ class DataProcessor:
         elements.append(Spacer(1, 0.3*inch))
         
         # Resumen estadístico
-        summary_style = ParagraphStyle(
-            'Summary',
-            parent=styles['Normal'],
-            fontSize=10,
-            spaceAfter=10
-        )
+        summary_style = pdf_styles['summary']
         
         summary_text = f"""
         <b>Resumen del Ranking:</b><br/>
-        • Total de ponencias evaluadas: {len(df_filtered)}<br/>
-        • Puntaje promedio: {df_filtered['Puntaje'].mean():.2f}<br/>
-        • Puntaje más alto: {df_filtered['Puntaje'].max():.2f}<br/>
+        • Total de ponencias evaluadas: {len(candidates)}<br/>
+        • Puntaje promedio: {puntajes.mean():.2f}<br/>
+        • Puntaje más alto: {puntajes.max():.2f}<br/>
         • Puntaje más bajo (Top {top_n}): {df_top['Puntaje'].min():.2f}
         """
         
@@ -522,42 +825,31 @@ class DataProcessor:
         }
         
         # Estilo para texto con wrapping
-        text_style = ParagraphStyle(
-            'CellText',
-            parent=styles['Normal'],
-            fontSize=7.5,
-            leading=10,
-            wordWrap='CJK',
-            splitLongWords=True,
-            breakLongWords=True
-        )
+        text_style = pdf_styles['text']
         
         # Estilo para el código de país con fondo
-        country_style = ParagraphStyle(
-            'CountryCode',
-            parent=styles['Normal'],
-            fontSize=7,
-            textColor=colors.HexColor('#FFFFFF'),
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        )
+        country_style = pdf_styles['country']
         
         # Crear datos de la tabla
         # Headers con nombres traducidos
         table_headers = [column_display_names.get(col, col) for col in columns]
         table_data = [table_headers]
         
-        for idx, row in df_top.iterrows():
+        # Códigos de país: sobre una columna categórica, map se aplica una vez por país distinto
+        if 'País' in df_top.columns:
+            country_codes = (
+                df_top['País'].map(get_country_code, na_action='ignore')
+                .astype(object).fillna('').tolist()
+            )
+        else:
+            country_codes = [''] * len(df_top)
+        
+        # Recorrer las columnas como listas, sin construir una Series por fila
+        for country_code, *values in zip(country_codes, *(df_top[col].tolist() for col in columns)):
             row_data = []
-            for col in columns:
-                value = row[col]
+            for col, value in zip(columns, values):
                 # Formatear valores
                 if col == 'Resultado':
-                    # Obtener código del país
-                    country_code = ''
-                    if 'País' in row.index:
-                        country_code = get_country_code(row['País'])
-                    
                     # Crear formato con código de país y ranking
                     if country_code:
                         # Usar HTML con fondo de color para el código de país
@@ -676,57 +968,30 @@ class DataProcessor:
         elements.append(Spacer(1, 0.4*inch))
 
         # Título de la sección
-        comision_title_style = ParagraphStyle(
-            'ComisionTitle',
-            parent=styles['Heading2'],
-            fontSize=12,
-            textColor=colors.HexColor('#1f77b4'),
-            spaceAfter=10,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        )
+        comision_title_style = pdf_styles['comision_title']
         elements.append(Paragraph("Integrantes de la Comisión Póster", comision_title_style))
 
         # Leer archivo de integrantes
         integrantes_path = "integrantes.xlsx"
         if os.path.exists(integrantes_path):
             try:
-                df_integrantes = pd.read_excel(integrantes_path)
+                integrantes = _load_integrantes(integrantes_path, os.path.getmtime(integrantes_path))
 
                 # Estilo para los nombres de integrantes
-                integrante_style = ParagraphStyle(
-                    'IntegranteStyle',
-                    parent=styles['Normal'],
-                    fontSize=9,
-                    alignment=TA_CENTER,
-                    spaceAfter=4
-                )
+                integrante_style = pdf_styles['integrante']
 
                 # Agregar cada integrante
-                for _, row in df_integrantes.iterrows():
-                    nombre = str(row.iloc[0])  # Primera columna
+                for nombre in integrantes:
                     elements.append(Paragraph(f"• {nombre}", integrante_style))
 
             except Exception as e:
                 # Si hay error leyendo el archivo, agregar nota
-                error_style = ParagraphStyle(
-                    'ErrorStyle',
-                    parent=styles['Normal'],
-                    fontSize=8,
-                    textColor=colors.HexColor('#999999'),
-                    alignment=TA_CENTER
-                )
+                error_style = pdf_styles['error']
                 elements.append(Paragraph(f"(No se pudo cargar la lista de integrantes)", error_style))
 
         # Pie de página con información adicional
         elements.append(Spacer(1, 0.3*inch))
-        footer_style = ParagraphStyle(
-            'Footer',
-            parent=styles['Normal'],
-            fontSize=8,
-            textColor=colors.HexColor('#999999'),
-            alignment=TA_CENTER
-        )
+        footer_style = pdf_styles['footer']
         elements.append(Paragraph("Dashboard Convención de Suelos - Pucallpa 2025", footer_style))
         elements.append(Paragraph("Sistema de Análisis y Gestión de Pósteres", footer_style))
 
@@ -734,11 +999,9 @@ class DataProcessor:
         elements.append(Spacer(1, 0.4*inch))
         footer_image_path = "images/footer.png"
         if os.path.exists(footer_image_path):
-            # Obtener dimensiones reales de la imagen
-            from PIL import Image as PILImage
-            with PILImage.open(footer_image_path) as img:
-                img_width, img_height = img.size
-                aspect_ratio = img_height / img_width
+            # Obtener dimensiones reales de la imagen (en caché mientras el archivo no cambie)
+            img_width, img_height = _image_size(footer_image_path, os.path.getmtime(footer_image_path))
+            aspect_ratio = img_height / img_width
 
             # Ancho completo de la página (de margen a margen)
             page_width = 7.5 * inch